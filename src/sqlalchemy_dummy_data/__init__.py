@@ -1,7 +1,9 @@
 """
 """
+import collections
 import itertools
 import logging
+from types import MappingProxyType
 from typing import (
     Any,
     ClassVar,
@@ -9,15 +11,18 @@ from typing import (
     Generator,
     Iterable,
     List,
+    Mapping,
     Optional,
+    Sequence,
     Set,
+    Tuple,
     Type,
     TypeAlias,
     TypedDict,
     overload,
 )
 
-from sqlalchemy import Column, Select, inspect, select
+from sqlalchemy import Column, Connection, Select, insert, inspect, select
 from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute
 from typing_extensions import NotRequired, Self, Unpack
 
@@ -29,12 +34,23 @@ from sqlalchemy_dummy_data.seq import KwargsSequencer, SequencerCallable, iters
 __version__ = "0.0.0"
 logger = logging.getLogger(__name__)
 
+# Maps `(exclude_primary, only_primary)` to the `BaseDummyMeta` attribute
+# holding that variant of the foreign keys.
+FKS_VARIANTS: Dict[Tuple[bool, bool], str] = {
+    (False, False): "fks",
+    (True, False): "fks_nonprimary",
+    (False, True): "fks_primary",
+}
+
 
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%% #
 # Types
 
-Pks: TypeAlias = Dict[str, Dict[str, List[int]]]
+# Only the bounds of the key pools are used, so compact sequences such as
+# `range` objects may be used in place of lists.
+Pks: TypeAlias = Dict[str, Dict[str, Sequence[int]]]
 IterFks: TypeAlias = Generator[Dict[str, int], None, None]
+IterFksBatched: TypeAlias = Generator[List[Dict[str, int]], None, None]
 
 
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%% #
@@ -46,27 +62,42 @@ class KwargsFks(TypedDict):
     only_primary: NotRequired[bool]
 
 
-class KwargsIterFks(KwargsFks, KwargsSequencer):
-    ...
-
-
 class BaseDummyMeta:
     """
     :attr tables: A mapping from table names to table mapped class name.
     :attr tablenames: Set of all tablenames.
     :attr fks: A mapping from tablenames to a mapping of primary key names
         to their respective `InstrumentedAttribute`s.
+    :attr fks_primary: Like :attr:`fks` but only for foreign keys that are
+        also primary keys.
+    :attr fks_nonprimary: Like :attr:`fks` but only for foreign keys that are
+        not primary keys.
     :attr pks: Like :attr:`fks` but for primary keys.
+    :attr pks_domestic: Like :attr:`pks` but only for primary keys that are
+        not also foreign keys.
     :attr pknames: Set of primary key names.
     :attr fknames: Set of foreign key names.
+    :attr insert_order: Cached output of :meth:`get_insert_order`, `None`
+        until it is first computed or when a table has been registered since.
+    :attr fk_owners: Cached output of :meth:`DummyMixins.get_fk_owners`, keyed
+        by tablename and the name of the :attr:`fks` variant. Cleared when a
+        table is registered.
+    :attr fk_selects: Like :attr:`fk_owners` but for
+        :meth:`DummyMixins.get_fk_selects`.
     """
 
     tables: ClassVar[Dict[str, "DeclarativeMeta | DummyMixins"]]
     tablenames: ClassVar[Set[str]]
-    fks: ClassVar[Dict[str, Dict[str, Column]]]
-    pks: ClassVar[Dict[str, Dict[str, Column]]]
+    fks: ClassVar[Dict[str, Mapping[str, Column]]]
+    fks_primary: ClassVar[Dict[str, Mapping[str, Column]]]
+    fks_nonprimary: ClassVar[Dict[str, Mapping[str, Column]]]
+    pks: ClassVar[Dict[str, Mapping[str, Column]]]
+    pks_domestic: ClassVar[Dict[str, Mapping[str, Column]]]
     pknames: ClassVar[Set[str]]
     fknames: ClassVar[Set[str]]
+    insert_order: ClassVar[Optional[Tuple[str, ...]]]
+    fk_owners: ClassVar[Dict[Tuple[str, str], Mapping[str, Any]]]
+    fk_selects: ClassVar[Dict[Tuple[str, str], Mapping[str, Select]]]
 
     @classmethod
     def _registerTable(cls, Table):
@@ -80,16 +111,136 @@ class BaseDummyMeta:
         name = Table.__tablename__
         cls.tablenames.add(name)
 
+        # Classify the foreign keys in a single pass over the columns.
         table_details = inspect(Table)
-        cls.pks[name] = {p.name: p for p in table_details.primary_key}
-        cls.fks[name] = {
-            name: column
-            for name, column in table_details.columns.items()
-            if column.foreign_keys
-        }
+        fks: Dict[str, Column] = dict()
+        fks_primary: Dict[str, Column] = dict()
+        fks_nonprimary: Dict[str, Column] = dict()
+        for fname, column in table_details.columns.items():
+            if not column.foreign_keys:
+                continue
+            fks[fname] = column
+            if column.primary_key:
+                fks_primary[fname] = column
+            else:
+                fks_nonprimary[fname] = column
+
+        # Read only views so that consumers cannot mutate the registry.
+        pks = {p.name: p for p in table_details.primary_key}
+        pks_domestic = {pname: p for pname, p in pks.items() if pname not in fks}
+        cls.pks[name] = MappingProxyType(pks)
+        cls.pks_domestic[name] = MappingProxyType(pks_domestic)
+        cls.fks[name] = MappingProxyType(fks)
+        cls.fks_primary[name] = MappingProxyType(fks_primary)
+        cls.fks_nonprimary[name] = MappingProxyType(fks_nonprimary)
         cls.pknames.update(cls.pks[name].keys())
         cls.fknames.update(cls.fks[name].keys())
         cls.tables[name] = Table
+        cls.insert_order = None
+        cls.fk_owners.clear()
+        cls.fk_selects.clear()
+
+    @classmethod
+    def get_insert_order(cls) -> Tuple[str, ...]:
+        """Order the tablenames such that the owners of foreign keys come
+        before the tables that reference them, i.e. the order in which tables
+        should be loaded. Uses Kahn's algorithm and is only recomputed after a
+        table is registered.
+
+        Tables that are part of a cycle cannot be ordered and are appended in
+        alphabetical order.
+
+        :returns: A tuple of tablenames.
+        """
+
+        if cls.insert_order is not None:
+            return cls.insert_order
+
+        # Owners are resolved here and not in `_registerTable` since they may
+        # not be declared when the referencing table is registered.
+        parents = {
+            name: {
+                owner
+                for column in cls.fks[name].values()
+                for fk in column.foreign_keys
+                if (owner := fk.column.table.name) != name and owner in cls.tablenames
+            }
+            for name in cls.tablenames
+        }
+        children: Dict[str, Set[str]] = {name: set() for name in parents}
+        for name, owners in parents.items():
+            for owner in owners:
+                children[owner].add(name)
+
+        indegree = {name: len(owners) for name, owners in parents.items()}
+        queue = collections.deque(sorted(n for n, d in indegree.items() if not d))
+        order: List[str] = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for child in sorted(children[name]):
+                indegree[child] -= 1
+                if not indegree[child]:
+                    queue.append(child)
+
+        if len(order) != len(parents):
+            cyclic = sorted(set(parents) - set(order))
+            logger.warning("Tables `%s` form a cycle and cannot be ordered.", cyclic)
+            order.extend(cyclic)
+
+        cls.insert_order = tuple(order)
+        return cls.insert_order
+
+    @classmethod
+    def iter_fk_closure(cls, name: str) -> Generator[str, None, None]:
+        """Walk the foreign keys of the table named :param:`name` and those of
+        the tables that own them, and so on. Every table is yielded once, so
+        cycles are safe and shared owners are not descended into again.
+
+        :param name: Tablename to start from. This is yielded first.
+        :returns: A generator of tablenames.
+        """
+
+        seen: Set[str] = set()
+        stack = [name]
+        while stack:
+            if (current := stack.pop()) in seen:
+                continue
+            seen.add(current)
+            yield current
+
+            stack.extend(
+                owner
+                for column in cls.fks[current].values()
+                for fk in column.foreign_keys
+                if (owner := fk.column.table.name) not in seen
+                and owner in cls.tablenames
+            )
+
+    @classmethod
+    def insert_rows(
+        cls,
+        connection: Connection,
+        name: str,
+        rows: List[Dict[str, Any]],
+    ) -> int:
+        """Insert :param:`rows` into the table named :param:`name` with a
+        single Core `executemany`, bypassing the `Session`.
+
+        Since no instances are created, no ORM events or python side defaults
+        from `__init__` fire. Column defaults are still applied. For drivers
+        supporting `insertmanyvalues` the page size is an engine option, i.e.
+        `create_engine(..., insertmanyvalues_page_size=...)`.
+
+        :param connection: Connection to insert with.
+        :param name: Tablename of a registered table.
+        :param rows: Parameters for `executemany`.
+        :returns: The number of rows inserted.
+        """
+
+        if rows:
+            connection.execute(insert(cls.tables[name].__table__), rows)  # type: ignore
+        return len(rows)
 
 
 class DummyMixins:
@@ -113,56 +264,111 @@ class DummyMixins:
     # `get` prefixed methods.
 
     @classmethod
-    def get_fks(cls, **kwargs: Unpack[KwargsFks]) -> Dict[str, Column]:
-        """Get the foreign keys for `cls`.
+    def get_fks(cls, **kwargs: Unpack[KwargsFks]) -> Mapping[str, Column]:
+        """Get the foreign keys for `cls`. All variants are computed by
+        :meth:`BaseDummyMeta._registerTable`.
 
         :param exclude_primary: When `True`, only return foreign keys that are
-            also primary keys.
+            not also primary keys.
+        :param only_primary: When `True`, only return foreign keys that are
+            also primary keys. Cannot be used with :param:`exclude_primary`.
+        :raises ValueError: When both options are used.
         :returns: A dictionary of foreign key names mapping to the foreign key
             `InstrumentedAttribute`s.
         """
-        f = cls.__dummies__.fks[cls.__tablename__]
-        match [
-            kwargs.get("exclude_primary", False),
-            kwargs.get("only_primary", False),
-        ]:
-            case [True, True]:
-                msg = "Cannot use both `exclude_primary` and `only_primary`."
-                raise ValueError(msg)
-            case [True, False]:
-                # non primary
-                return {tn: ia for tn, ia in f.items() if not ia.primary_key}
-            case [False, True]:
-                # non foreign.
-                return {tn: ia for tn, ia in f.items() if ia.primary_key}
-            case _:
-                # all.
-                return f
+        if not kwargs:
+            return cls.__dummies__.fks[cls.__tablename__]
+        variant = getattr(cls.__dummies__, cls._fks_variant(**kwargs))
+        return variant[cls.__tablename__]
+
+    @classmethod
+    def _fks_variant(cls, **kwargs: Unpack[KwargsFks]) -> str:
+        """Get the name of the :class:`BaseDummyMeta` attribute holding the
+        foreign keys described by :param:`kwargs`.
+
+        :param kwargs: See :meth:`get_fks`.
+        :raises ValueError: When both options are used.
+        """
+        variant = (
+            bool(kwargs.get("exclude_primary", False)),
+            bool(kwargs.get("only_primary", False)),
+        )
+        if (attr := FKS_VARIANTS.get(variant)) is None:
+            msg = "Cannot use both `exclude_primary` and `only_primary`."
+            raise ValueError(msg)
+        return attr
 
     @classmethod
     def get_fk_owners(
         cls, **kwargs: Unpack[KwargsFks]
-    ) -> Dict[str, DeclarativeMeta | Self]:
-        """Get owners of the various foreign keys.
+    ) -> Mapping[str, DeclarativeMeta | Self]:
+        """Get owners of the various foreign keys. Results are cached. Owners
+        are resolved lazily since they may not be registered when `cls` is.
 
         :param exclude_primary: Exclude results for primary foreign keys.
         :returns: A mapping of tablenames to tables for the foreign keys of
             `cls`.
         """
+        key = (cls.__tablename__, cls._fks_variant(**kwargs))
+        if (cached := cls.__dummies__.fk_owners.get(key)) is not None:
+            return cached
+
         fks = cls.get_fks(**kwargs)
-        return {
-            fname: cls.__dummies__.tables[fk.column.table.name]
-            for fname, ff in fks.items()
-            for fk in ff.foreign_keys
-        }
+        if kwargs:
+            # Variants are slices of the complete mapping, so that the
+            # `foreign_keys` of each column are only walked once.
+            all_owners = cls.get_fk_owners()
+            owners = {fname: all_owners[fname] for fname in fks}
+        else:
+            tables = cls.__dummies__.tables
+            owners = {
+                fname: tables[fk.column.table.name]
+                for fname, ff in fks.items()
+                for fk in ff.foreign_keys
+            }
+
+        cls.__dummies__.fk_owners[key] = MappingProxyType(owners)
+        return cls.__dummies__.fk_owners[key]
+
+    @classmethod
+    def get_fk_selects(cls, **kwargs: Unpack[KwargsFks]) -> Mapping[str, Select]:
+        """Get queries for the keys available to the foreign keys of `cls`.
+        Like :meth:`get_fk_owners`, results are cached and resolved lazily so
+        that each `Select` is only constructed once.
+
+        :param kwargs: See :meth:`get_fks`.
+        :returns: A mapping of foreign key names to a `Select` of the column
+            they reference.
+        """
+        key = (cls.__tablename__, cls._fks_variant(**kwargs))
+        if (cached := cls.__dummies__.fk_selects.get(key)) is not None:
+            return cached
+
+        fks = cls.get_fks(**kwargs)
+        if kwargs:
+            all_selects = cls.get_fk_selects()
+            selects = {fname: all_selects[fname] for fname in fks}
+        else:
+            selects = {
+                fname: select(fk.column)
+                for fname, ff in fks.items()
+                for fk in ff.foreign_keys
+            }
+
+        cls.__dummies__.fk_selects[key] = MappingProxyType(selects)
+        return cls.__dummies__.fk_selects[key]
 
     @classmethod
-    def get_pks(cls) -> Dict[str, Column]:
+    def get_pks(cls, exclude_foreign: bool = False) -> Mapping[str, Column]:
         """Get the primary keys of `cls`.
 
+        :param exclude_foreign: When `True`, only return primary keys that are
+            not also foreign keys.
         :returns: A mapping of primary key names to their respective
             `InstrumentedAttribute`.
         """
+        if exclude_foreign:
+            return cls.__dummies__.pks_domestic[cls.__tablename__]
         return cls.__dummies__.pks[cls.__tablename__]
 
     @classmethod
@@ -191,7 +397,7 @@ class DummyMixins:
         all_pks: Pks,
         /,
         **kwargs: Unpack[KwargsFks],
-    ) -> Dict[str, List[int]]:
+    ) -> Dict[str, Sequence[int]]:
         ...
 
     @classmethod
@@ -200,7 +406,7 @@ class DummyMixins:
         all_pks: None | Pks,
         /,
         **kwargs: Unpack[KwargsFks],
-    ) -> Dict[str, List[int]] | Dict[str, Select]:
+    ) -> Dict[str, Sequence[int]] | Dict[str, Select]:
         """Get a tables potential foreign keys and return them as a `dict` of
         lists when providing `all_pks`. Otherwise, return the queries that will
         generate `all_pks`. I cannot say which is more efficient.
@@ -209,20 +415,15 @@ class DummyMixins:
         :returns: See desc.
         """
 
-        def select_fks(name, owner_name) -> List[int] | Select:
-            if all_pks is not None:
-                return all_pks[owner_name][name]
-            else:
-                return select(
-                    cls.__dummies__.tables[owner_name].get_pk(name)  # type: ignore
-                )
+        if all_pks is None:
+            return dict(cls.get_fk_selects(**kwargs))
 
+        # The owners are already resolved, do not look them up again by name.
         fk_owners = cls.get_fk_owners(**kwargs)
-        fk_coproduct: Dict[str, Select] | Dict[str, List[int]] = {
-            name: select_fks(name, owner.__tablename__)  # type: ignore
+        return {
+            name: all_pks[owner.__tablename__][name]  # type: ignore
             for name, owner in fk_owners.items()
         }
-        return fk_coproduct
 
     # ----------------------------------------------------------------------- #
 
@@ -231,43 +432,59 @@ class DummyMixins:
         cls,
         all_pks: Optional[Pks],
         sequencer: Optional[SequencerCallable] = None,
-        **kwargs: Unpack[KwargsIterFks],
+        *,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+        **kwargs: Unpack[KwargsFks],
     ) -> Generator[Dict[str, int], None, None]:
         """Returns a generator of key/value mappings. This should expend all
         values in the cartesian product of the foreign keys specfied by
         :param:`kwargs`.
 
         This should iter fks without adding repitions/randomness. Such
-        behavior should be placed in the consuming function.
+        behavior should be placed in the consuming function. When `cls` has
+        no foreign keys of the requested kind an empty mapping is yielded
+        indefinitely so that the output can be zipped with the others.
 
+        :param start: See :class:`KwargsSequencer`. Not allowed with
+            :param:`all_pks`, which determines the bounds instead.
+        :param stop: Like :param:`start`.
         :param kwargs: See :meth:`get_fks`.
         """
 
-        skwargs: KwargsSequencer
+        skwargs = KwargsSequencer()
 
         if all_pks is not None:
-            if "start" in kwargs or "stop" in kwargs:
+            if start is not None or stop is not None:
                 msg = "Cannot specify both `all_pks` and `start` or `stop`."
                 raise ValueError(msg)
-            X = all_pks[cls.__tablename__].values()
-            skwargs = KwargsSequencer(
-                start=max(min(x) for x in X),
-                stop=min(max(x) for x in X),
-            )
+
+            # Bound the sequence by the keys available in the owners of the
+            # foreign keys, not those of `cls`.
+            coproduct = cls._create_coproduct(all_pks, **kwargs)
+            labels = tuple(coproduct)
+            if labels:
+                X = coproduct.values()
+                skwargs["start"] = max(min(x) for x in X)
+                skwargs["stop"] = min(max(x) for x in X)
         else:
-            skwargs = KwargsSequencer(
-                {  # type: ignore
-                    key: value
-                    for key in ("start", "stop")
-                    if (value := kwargs.pop(key, None)) is not None
-                }
-            )
+            if start is not None:
+                skwargs["start"] = start
+            if stop is not None:
+                skwargs["stop"] = stop
+
+            # Only the labels are needed by the sequencer, so do not build the
+            # coproduct (which constructs a `Select` per foreign key).
+            labels = tuple(cls.get_fks(**kwargs))
+
+        if not labels:
+            yield from itertools.repeat({})
+            return
 
         if sequencer is None:
             sequencer = iters.squared
 
-        coproduct = cls._create_coproduct(all_pks, **kwargs)
-        yield from sequencer(*coproduct, **skwargs)
+        yield from sequencer(*labels, **skwargs)
 
     @classmethod
     def _create_iter_pks(
@@ -292,21 +509,32 @@ class DummyMixins:
         Finally, I'd like to be able to switch out the algorithm to do this as
         well as apply this in :meth:`create_iter_fks`. Ideally these sequences
         will be somewhat randomized.
+
+        Only domestic primary keys are iterated, primary foreign keys come from
+        :meth:`_create_iter_fks`. Like :meth:`_create_iter_fks`, empty mappings
+        are yielded indefinitely when there are no domestic primary keys.
         """
 
+        if all_pks is not None and "start" in kwargs:
+            raise ValueError("Cannot specify both `all_pks` and `start`.")
+
+        # Association tables have no domestic keys, and so need no entry in
+        # :param:`all_pks`.
+        labels = tuple(cls.get_pks(exclude_foreign=True))
+        if not labels:
+            yield from itertools.repeat({})
+            return
+
         if all_pks is not None:
-            if "start" in kwargs:
-                raise ValueError("Cannot specify both `all_pks` and `start`.")
-            else:
-                kwargs["start"] = max(
-                    max(thing) for thing in all_pks[cls.__tablename__].values()
-                )
+            # Start after the greatest existing key.
+            kwargs["start"] = 1 + max(
+                max(thing) for thing in all_pks[cls.__tablename__].values()
+            )
 
         if sequencer is None:
             sequencer = iters.squared
 
-        pks = cls.get_pks()
-        yield from sequencer(*pks, **kwargs)
+        yield from sequencer(*labels, **kwargs)
 
     @classmethod
     def create_iter_fks(cls, all_pks: Pks) -> IterFks:
@@ -334,13 +562,68 @@ class DummyMixins:
         fks = cls._create_iter_fks(all_pks, exclude_primary=True)
         pks = cls._create_iter_pks(all_pks)
 
-        while (
-            (pk := next(pks)) is not None
-            and (fk := next(fks)) is not None
-            and (pk_fk := next(pk_fks)) is not None
-        ):
-            pk_fk = next(pk_fks)
-            yield dict(**pk_fk, **fk, **pk)
+        # A single dict display builds each row in one allocation, chaining
+        # `|` would allocate an intermediate dict per row. Updating a reused
+        # buffer and yielding copies of it is about twice as slow, and yielding
+        # the buffer itself would break :meth:`create_iter_fks_batched`.
+        for pk_fk, fk, pk in zip(pk_fks, fks, pks):
+            yield {**pk_fk, **fk, **pk}
+
+    @classmethod
+    def create_iter_fks_batched(
+        cls,
+        all_pks: Pks,
+        batch_size: int = 10_000,
+        limit: Optional[int] = None,
+    ) -> IterFksBatched:
+        """Like :meth:`create_iter_fks` but yields lists of rows to be used
+        directly as `executemany` parameters, e.g.
+        `connection.execute(insert(Table), batch)`.
+
+        :param all_pks: See :meth:`create_iter_fks`.
+        :param batch_size: Greatest number of rows per batch. The last batch
+            may be smaller.
+        :param limit: Greatest number of rows in total. Tables without foreign
+            keys are otherwise iterated indefinitely.
+        :raises ValueError: When :param:`batch_size` is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be positive.")
+
+        rows = itertools.islice(cls.create_iter_fks(all_pks), limit)
+        while batch := list(itertools.islice(rows, batch_size)):
+            yield batch
+
+    # ======================================================================= #
+    # INSERTION
+    #
+    # Methods that require a connection.
+
+    @classmethod
+    def insert_dummies(
+        cls,
+        connection: Connection,
+        all_pks: Pks,
+        batch_size: int = 10_000,
+        limit: Optional[int] = None,
+    ) -> int:
+        """Insert the rows of :meth:`create_iter_fks_batched` with one Core
+        `executemany` per batch. The ORM unit of work is skipped entirely so
+        no instances are created, flushed, or refreshed.
+
+        Committing is left to the caller.
+
+        :param connection: Connection to insert with.
+        :param all_pks: See :meth:`create_iter_fks`.
+        :param batch_size: See :meth:`create_iter_fks_batched`.
+        :param limit: See :meth:`create_iter_fks_batched`.
+        :returns: The number of rows inserted.
+        """
+
+        return sum(
+            cls.__dummies__.insert_rows(connection, cls.__tablename__, batch)
+            for batch in cls.create_iter_fks_batched(all_pks, batch_size, limit)
+        )
 
     # @classmethod
     # def createDummies(cls, table, pks: Pks) -> Generator[Self, None, None]:
@@ -366,9 +649,16 @@ class DummyMixins:
 def create_dummy_meta(Base) -> Type:
     """Use this to create a metaclass instance for dummy data generation.
 
+    The metaclass is stored on `Base` so that later calls with the same
+    `Base` (e.g. when models are reloaded) share one registry instead of
+    inspecting every table again.
+
     :returns: A dummy data metaclass.
     """
 
+    if (existing := Base.__dict__.get("__dummy_meta__")) is not None:
+        return existing
+
     class DummyMeta(BaseDummyMeta):
         """Metaclass for dummy data generation.
 
@@ -378,9 +668,15 @@ def create_dummy_meta(Base) -> Type:
         tables = dict()
         tablenames = set()
         fks = dict()
+        fks_primary = dict()
+        fks_nonprimary = dict()
         pks = dict()
+        pks_domestic = dict()
         pknames = set()
         fknames = set()
+        insert_order = None
+        fk_owners = dict()
+        fk_selects = dict()
 
         #     @classmethod
         #     def _verifyCreateDummyArgs(cls, name, bases, dict_):
@@ -398,17 +694,51 @@ def create_dummy_meta(Base) -> Type:
         #         util.comparesigs(DummyMixins.createDummyArgs, fn)
 
         def __new__(cls, name, bases, dict_):
-            """Register and create type."""
+            """Register and create type.
+
+            Recreating a registered table from the same raw bases, name and no
+            additional namespace returns the registered type rather than
+            inspecting it again. Any other type using a registered tablename
+            is created as usual, so that SQLAlchemy reports the conflict.
+            Types with a truthy `__no_dummies__` in their namespace or raw
+            bases are created but not registered.
+            """
 
             # Check that 'createDummyArgs' is defined:
             # cls._verifyCreateDummyArgs(name, bases, dict_)
 
+            # Registered types are bases for inheritance, their attributes
+            # should not be mistaken for those of the new type.
+            raw = tuple(b for b in bases if b.__dict__.get("__dummies__") is not cls)
+
+            def lookup(attr: str) -> Any:
+                if attr in dict_:
+                    return dict_[attr]
+                return next(
+                    (v for b in raw if (v := getattr(b, attr, None)) is not None),
+                    None,
+                )
+
+            tablename = lookup("__tablename__")
+            if (
+                bases
+                and raw == bases
+                and (T := cls.tables.get(tablename)) is not None
+                and T.__name__ == name
+                and T.__bases__[2:] == bases
+                and not set(dict_) - {"__module__", "__qualname__", "__dummies__"}
+            ):
+                logger.debug("Table `%s` is already registered.", tablename)
+                return T
+
             # Create and register instance.
             dict_["__dummies__"] = cls
             T = type(name, (Base, DummyMixins, *bases), dict_)
-            cls._registerTable(T)
+            if not lookup("__no_dummies__"):
+                cls._registerTable(T)
             return T
 
+    setattr(Base, "__dummy_meta__", DummyMeta)
     return DummyMeta
 
 
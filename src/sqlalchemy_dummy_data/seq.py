@@ -10,7 +10,17 @@ new entries will have `a == 1`.
 """
 
 import itertools
-from typing import Dict, Generator, Iterable, List, Optional, Protocol, Tuple, TypedDict
+from typing import (
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypedDict,
+)
 
 from typing_extensions import NotRequired, Unpack
 
@@ -115,25 +125,23 @@ class iters:
     @classmethod
     def count(
         cls, start: Optional[int] = None, stop: Optional[int] = None
-    ) -> Generator[int, None, None]:
+    ) -> Iterator[int]:
         """Sould 'work like' range except with optional indefinite iteration.
+        Both cases are delegated to iterators implemented in C.
 
         :param start: 1 if not overridden.
         :param stop: Iteration will terminate at this value if specified.
         """
 
         start = start or 1
-        if stop is not None and start > stop:
+        if stop is None:
+            return itertools.count(start)
+        elif start > stop:
             msg = "`start` parameter must be less than or equal to `stop` "
             msg += "parameter."
             raise ValueError(msg)
 
-        k = start
-        while True:
-            yield k
-            if stop is not None and k >= stop:
-                break
-            k += 1
+        return iter(range(start, stop + 1))
 
     @classmethod
     def _triangled(
@@ -149,12 +157,28 @@ class iters:
 
         if not n:
             raise ValueError("Arguments must have length of 1 or greater.")
-        elif n == 1:
+
+        # The inner dimensions are always bounded by the next coordinate, so
+        # they can be iterated by `range`. The most common dimensions are
+        # unrolled to avoid the recursion and building tuples by unpacking.
+        start = start or 1
+        if n == 1:
             yield from ((item,) for item in cls.count(start, stop))
             return
+        elif n == 2:
+            for b in cls.count(start, stop):
+                for a in range(start, b + 1):
+                    yield (a, b)
+            return
+        elif n == 3:
+            for c in cls.count(start, stop):
+                for b in range(start, c + 1):
+                    for a in range(start, b + 1):
+                        yield (a, b, c)
+            return
 
         for coord in cls._triangled(n - 1, start=start, stop=stop):
-            for ext in cls.count(start, coord[0]):
+            for ext in range(start, coord[0] + 1):
                 yield (ext, *coord)
 
     @classmethod
@@ -166,8 +190,16 @@ class iters:
         :param items: See :meth:`_triangled`.
         :returns: See function description.
         """
+        # Only tuples with repeated members need their permutations deduped,
+        # which saves hashing every permutation for most tuples.
         for item in cls._triangled(n, start=start, stop=stop):
-            yield from set(itertools.permutations(item))
+            distinct = len(set(item))
+            if distinct == n:
+                yield from itertools.permutations(item)
+            elif distinct == 1:
+                yield item
+            else:
+                yield from set(itertools.permutations(item))
 
     @classmethod
     def triangled(
@@ -179,10 +211,8 @@ class iters:
         sequence members and :class:`SequencerCallable` for parameter
         descriptions.
         """
-        counters = {label: cls.count(**kwargs) for label in labels}
         yield from (
-            {k: v for k, v in zip(counters, coord)}
-            for coord in cls._triangled(len(labels), **kwargs)
+            dict(zip(labels, coord)) for coord in cls._triangled(len(labels), **kwargs)
         )
 
     @classmethod
@@ -193,8 +223,6 @@ class iters:
         sequence members and :class:`SequencerCallable` for parameter
         descriptions.
         """
-        counters = {label: cls.count(**kwargs) for label in labels}
         yield from (
-            {k: v for k, v in zip(counters, coord)}
-            for coord in cls._squared(len(labels), **kwargs)
+            dict(zip(labels, coord)) for coord in cls._squared(len(labels), **kwargs)
         )
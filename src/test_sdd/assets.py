@@ -10,6 +10,12 @@ from typing import Any
 
 import yaml
 
+# PyYAML only provides the C loader when built against libyaml.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore
+
 PATH_ROOT = path.realpath(path.join(path.dirname(__file__), "..", ".."))
 PATH_TESTS = path.join(PATH_ROOT, "src", "test_sdd")
 PATH_ASSETS = path.join(PATH_TESTS, "assets")
@@ -34,7 +40,7 @@ class Assets:
     @classmethod
     def yaml(cls, name) -> Any:
         with open(cls.asset(name), "r") as file:
-            return yaml.load(file, yaml.SafeLoader)
+            return yaml.load(file, SafeLoader)
 
     @classmethod
     def json(cls, name) -> Any:
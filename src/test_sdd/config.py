@@ -1,3 +1,4 @@
+import functools
 from typing import Optional
 
 import docker
@@ -7,6 +8,14 @@ from test_sdd import assets
 from test_sdd.controllers.docker import Servers
 
 
+@functools.cache
+def docker_client() -> docker.DockerClient:
+    """Get the docker client. It is created on first use rather than at import
+    time since creating it probes the docker daemon.
+    """
+    return docker.from_env()
+
+
 class Config(BaseYamlSettings):
     """Configuration for tests and fixtures.
 
@@ -21,16 +30,32 @@ class Config(BaseYamlSettings):
 class Context:
     """Stuff that will be needed to run views.
 
-    These values should be injected into controllers using a decorator.
+    These values should be injected into controllers using a decorator. Both
+    are created on first access so that importing a module which creates a
+    context does not parse the configuration or probe the docker daemon.
     """
 
-    config: Config
-    client: docker.DockerClient
+    __slots__ = ("_client", "_config")
+
+    _client: Optional[docker.DockerClient]
+    _config: Optional[Config]
 
     def __init__(
         self,
         _client: Optional[docker.DockerClient] = None,
         _config: Optional[Config] = None,
     ):
-        self.config = Config()  # type: ignore
-        self.client = docker.from_env()
+        self._client = _client
+        self._config = _config
+
+    @property
+    def config(self) -> Config:
+        if self._config is None:
+            self._config = Config()  # type: ignore
+        return self._config
+
+    @property
+    def client(self) -> docker.DockerClient:
+        if self._client is None:
+            self._client = docker_client()
+        return self._client
@@ -4,16 +4,13 @@ Includes docker tools for running tests against multiple SQL flavors.
 """
 import asyncio
 import logging
-from os import path
 
-import docker
 import pytest
 from sqlalchemy.engine import Engine as SQAEngine
-from yaml_settings_pydantic import BaseYamlSettings
 
 from test_sdd.cases import *
-from test_sdd.config import Config, Context
-from test_sdd.controllers.docker import Server, Servers, WithServers
+from test_sdd.config import Context, docker_client
+from test_sdd.controllers.docker import Server, WithServers, dispose_engines
 
 # =========================================================================== #
 # Helprs and constants
@@ -21,7 +18,6 @@ from test_sdd.controllers.docker import Server, Servers, WithServers
 PYTEST_CONTEXT = Context()
 logger = logging.getLogger(__name__)
 logger.level = logging.DEBUG
-DOCKER_CLIENT_TESTS = docker.from_env()
 
 
 # =========================================================================== #
@@ -36,9 +32,29 @@ def withservers(params):
 # Fixtures
 
 
-# TODO: Start all containers at once
-@pytest.fixture(params=[PYTEST_CONTEXT.config], scope="session", autouse=True)
-def Servers(request):
+@pytest.fixture(scope="session")
+def EventLoop():
+    """One event loop for the whole session, so that fixtures do not create
+    and tear down a loop each time they need to await something.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def DockerClient():
+    """The docker client shared by all fixtures. It is closed at the end of
+    the session.
+    """
+    client = docker_client()
+    yield client
+    client.close()
+    docker_client.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def Servers(EventLoop: asyncio.AbstractEventLoop, DockerClient):
     """Start and stop servers. This should only happen once per ``pytest```
     call.
 
@@ -46,22 +62,26 @@ def Servers(request):
     for a particular container. If you want to parametrize your tests with
     various engines use :class:`WithServers`.
 
-    :param request: ``param`` should be the desired configuration instance.
+    Not ``autouse``, so that tests which do not need a server (like those in
+    ``test_unit``, which use ``sqlite``) never touch docker. :func:`Engine`
+    requests this fixture.
+
+    All servers of ``PYTEST_CONTEXT.config`` are started concurrently. The
+    configuration is read here rather than in ``params`` so that importing
+    this module does not parse ``tests.yaml``.
     """
-    c = request.param
-    if not isinstance(c, Config):
-        raise ValueError("Parameter must be an instance of TestConfig.")
+    c = PYTEST_CONTEXT.config
 
-    client = docker.from_env()
-    engines = asyncio.run(c.servers.start(client))
+    engines = EventLoop.run_until_complete(c.servers.start(DockerClient))
     yield engines
-    asyncio.run(c.servers.stop(client))
+    dispose_engines()
+    EventLoop.run_until_complete(c.servers.stop(DockerClient))
 
 
-@pytest.fixture(params=[[PYTEST_CONTEXT.config, "mysql"]])
+@pytest.fixture(params=["mysql"])
 def ServerConfig(request) -> Server:
-    """Look for the server configuration with the driver ``request.params[1]``."""
-    config, driver = request.param
+    """Look for the server configuration with the driver ``request.param``."""
+    config, driver = PYTEST_CONTEXT.config, request.param
     if (
         server_configuration := next(
             (s for s in config.servers.servers),
@@ -73,10 +93,31 @@ def ServerConfig(request) -> Server:
 
 
 @pytest.fixture
-def Engine(ServerConfig: Server) -> SQAEngine:
+def Engine(
+    Servers,
+    ServerConfig: Server,
+    EventLoop: asyncio.AbstractEventLoop,
+    DockerClient,
+) -> SQAEngine:
     """Get an engine for this particular server configuration.
 
-    See :func:`ServerConfig`.
+    See :func:`ServerConfig`. Depending on :func:`Servers` makes sure that the
+    containers are up before the first engine is created.
     """
 
-    return asyncio.run(ServerConfig.engine(DOCKER_CLIENT_TESTS))
+    return EventLoop.run_until_complete(ServerConfig.engine(DockerClient))
+
+
+@pytest.fixture
+def Connection(Engine: SQAEngine):
+    """Get a connection to :func:`Engine` inside of a transaction that is
+    rolled back after the test.
+
+    The engine is shared by all tests using the same server, so tests should
+    prefer this over working with :func:`Engine` directly to not see each
+    others rows. Use ``connection.begin_nested`` for savepoints.
+    """
+    with Engine.connect() as connection:
+        transaction = connection.begin()
+        yield connection
+        transaction.rollback()
@@ -1,6 +1,9 @@
 import asyncio
 import functools
+import itertools
 import logging
+import os
+import secrets
 from typing import (
     Any,
     Callable,
@@ -12,7 +15,6 @@ from typing import (
     Set,
     TypeVar,
 )
-from uuid import uuid4
 
 import pytest
 from pydantic import BaseModel, Field, model_validator
@@ -22,6 +24,7 @@ from sqlalchemy.engine import create_engine
 from typing_extensions import ParamSpec, Self
 
 import docker
+from docker.errors import ImageNotFound, NotFound
 from docker.models.containers import Container as DockerContainer
 
 # =========================================================================== #
@@ -30,6 +33,7 @@ from docker.models.containers import Container as DockerContainer
 logger = logging.getLogger(__name__)
 logger.level = logging.DEBUG
 CONTAINER_BASENAME: str = "sqadd"
+ENGINES: Dict[URL, SQAEngine] = dict()
 
 
 T = ParamSpec("T")
@@ -37,14 +41,68 @@ S = TypeVar("S")
 
 
 def asyncronize(fn: Callable[T, S]) -> Callable[T, Coroutine[Any, Any, S]]:
+    @functools.wraps(fn)
     async def wrapper(*args: T.args, **kwargs: T.kwargs):
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         p = functools.partial(fn, *args, **kwargs)
         return await loop.run_in_executor(None, p)
 
     return wrapper
 
 
+async def wait_for_port(
+    host: str,
+    port: int,
+    timeout: float = 60,
+    delay: float = 0.1,
+) -> None:
+    """Wait until something accepts connections on ``host:port``.
+
+    :param host: Host to connect to.
+    :param port: Port to connect to.
+    :param timeout: Seconds to wait in total before giving up.
+    :param delay: Seconds before the first retry. Doubled after every
+        failed attempt, up to one second.
+    :raises TimeoutError: When nothing is listening in time.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            if loop.time() + delay > deadline:
+                msg = f"Nothing listening on `{host}:{port}` after {timeout}s."
+                raise TimeoutError(msg)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+@asyncronize
+def pull(client: docker.DockerClient, image: str) -> None:
+    """Pull :param:`image` unless it is already present locally.
+
+    :param client: A ``docker.DockerClient`` instance.
+    :param image: The image to pull, e.g. ``mysql:8``.
+    """
+    try:
+        client.images.get(image)
+    except ImageNotFound:
+        logger.debug("Pulling image `%s`.", image)
+        client.images.pull(image)
+
+
+def dispose_engines() -> None:
+    """Dispose of and forget every engine in :data:`ENGINES`."""
+    for engine in ENGINES.values():
+        engine.dispose()
+    ENGINES.clear()
+
+
 # =========================================================================== #
 # Configurations and their methods.
 
@@ -69,7 +127,7 @@ class Host(BaseModel):
     port: int = 3306
     database: str = "tests"
     username: str = "test_user"
-    password: str = Field(default_factory=uuid4)
+    password: str = Field(default_factory=secrets.token_hex)
 
 
 class Container(BaseModel):
@@ -130,14 +188,21 @@ class Server(BaseModel):
         return environ
 
     def container_name(self) -> str:
-        """Generate a container name."""
-        return self.container.name or "-".join(
+        """Generate a container name.
+
+        Under ``pytest-xdist`` the worker id is appended so that every worker
+        runs (and stops) its own container.
+        """
+        name = self.container.name or "-".join(
             (
                 CONTAINER_BASENAME,
                 self.container.image.replace(":", "-").replace("_", "-"),
                 self.driver or "default",
             )
         )
+        if (worker := os.environ.get("PYTEST_XDIST_WORKER")) is not None:
+            name += f"-{worker}"
+        return name
 
     async def url(self, client: docker.DockerClient) -> URL:
         """Create a URL to connect to the database."""
@@ -158,12 +223,21 @@ class Server(BaseModel):
         )
 
     async def engine(self, client: docker.DockerClient) -> SQAEngine:
-        """Get a connection pool for the server."""
-        logger.debug(
-            "Generating engine for container `%s`.",
-            self.container_name(),
-        )
-        return create_engine(url=await self.url(client))
+        """Get a connection pool for the server.
+
+        Engines are kept in :data:`ENGINES` by url, so every test using this
+        server shares one pool. Use :func:`dispose_engines` to close them.
+        Since the pool lives for the whole session, connections are pinged
+        on checkout in case the server dropped them.
+        """
+        url = await self.url(client)
+        if (engine := ENGINES.get(url)) is None:
+            logger.debug(
+                "Generating engine for container `%s`.",
+                self.container_name(),
+            )
+            engine = ENGINES[url] = create_engine(url=url, pool_pre_ping=True)
+        return engine
 
     def get(self, client: docker.DockerClient) -> DockerContainer | None:
         """Attempt to find the container state associated with this
@@ -176,12 +250,10 @@ class Server(BaseModel):
         """
         name = self.container_name()
         logger.debug("Searching for container `%s`.", name)
-        available: List[DockerContainer]
-        available = client.containers.list(all=True)  # type: ignore
-        return next(  # type: ignore
-            (c for c in available if c.name == name),
-            None,
-        )
+        try:
+            return client.containers.get(name)  # type: ignore
+        except NotFound:
+            return None
 
     @asyncronize
     def inspect(self, client: docker.DockerClient) -> Dict[str, Any] | None:
@@ -204,8 +276,29 @@ class Server(BaseModel):
     async def start(self, client: docker.DockerClient) -> SQAEngine:
         """Start the container associated with this configuration.
 
+        The docker calls block, so they are run in the executor. This lets
+        :meth:`Servers.start` boot every container at once. The engine is
+        returned once the database port accepts connections, so that the
+        first test does not wait on the server initializing.
+
         :param client: A ``docker.DockerClient`` instance.
         """
+        await self.run(client)
+        engine = await self.engine(client)
+        await wait_for_port(
+            engine.url.host,  # type: ignore
+            engine.url.port or self.hostspec.port,
+        )
+        return engine
+
+    @asyncronize
+    def run(self, client: docker.DockerClient) -> DockerContainer:
+        """Create or restart the container associated with this
+        configuration.
+
+        :param client: A ``docker.DockerClient`` instance.
+        :returns: The container.
+        """
         name = self.container_name()
         container: DockerContainer | None = self.get(client)
         if container is None:
@@ -222,12 +315,16 @@ class Server(BaseModel):
             if container is None:
                 msg = f"Failed to create container `{name}`."
                 raise AssertionError(msg)
-            elif container.status == "Exited":
+
+            # ``run`` returns the state from before the start, refresh once.
+            container.reload()
+            if container.status == "exited":
                 msg = f"Container `{name}` exited unexpectedly."
                 raise AssertionError(msg)
-        else:
-            logger.debug("`%s` already exists.", name)
+            return container
 
+        # ``get`` inspects the container, so its status is current.
+        logger.debug("`%s` already exists.", name)
         if container.status != "running":
             logger.debug(
                 "Container `%s` exists but is not running." " Attempting to start.",
@@ -241,7 +338,7 @@ class Server(BaseModel):
                 raise AssertionError(f"Failed to restart `{name}`.")
             """
 
-        return await self.engine(client)
+        return container
 
     @asyncronize
     def stop(self, client: docker.DockerClient, force: bool = False) -> None:
@@ -320,15 +417,52 @@ class Servers(BaseModel):
 
         return self
 
+    def select(self, server_ids: Optional[Iterable[str]] = None) -> List[Server]:
+        """Get the servers with the given ids, in configuration order.
+
+        :param server_ids: The :attr:`Server.id`s to select. Unknown ids are
+            ignored. If none are provided, then all servers are selected.
+        :returns: The selected servers.
+        """
+        if not server_ids:
+            return self.servers
+
+        # ``server_ids`` may be a list from the command line.
+        selected = set(server_ids)
+        return [s for s in self.servers if s.id in selected]
+
     async def hosts(
         self, client, server_ids: Optional[Iterable[str]] = None
-    ) -> Dict[str, Dict[str, Any]]:
-        if not server_ids:
-            server_ids = self.servers_included
-        tasks = {s.id: s.host(client) for s in self.servers if s.id in server_ids}
-        hosts = await asyncio.gather(*tasks.values())
+    ) -> Dict[str, Dict[str, str] | None]:
+        """Find the ip addresses of the containers for these servers.
+
+        One listing of the labeled containers carries the network settings
+        of all of them, so no container is inspected individually.
 
-        return {k: v for k, v in zip(tasks, hosts)}
+        :param client: A ``docker.DockerClient`` instance.
+        :param server_ids: The :attr:`Server.id`s of the servers to look up.
+            If none are provided, then all servers are looked up.
+        :returns: A mapping of server ids to mappings of network names to ip
+            addresses. Servers without a container map to ``None``.
+        """
+        servers = self.select(server_ids)
+        listed = await asyncronize(client.api.containers)(
+            all=True,
+            filters={"label": "sdd-tests"},
+        )
+        networks = {
+            name.lstrip("/"): item["NetworkSettings"]["Networks"]
+            for item in listed
+            for name in item["Names"]
+        }
+        return {
+            s.id: (
+                {name: spec["IPAddress"] for name, spec in nets.items()}
+                if (nets := networks.get(s.container_name())) is not None
+                else None
+            )
+            for s in servers
+        }
 
     async def start(
         self,
@@ -345,11 +479,14 @@ class Servers(BaseModel):
         :returns: All engines for te various mysql instances.
         """
         logger.info("Starting test containers.")
-        if not server_ids:
-            server_ids = self.servers_included
-        tasks = (s.start(client) for s in self.servers if s.id in server_ids)
-        servers = await asyncio.gather(*tasks)
-        return servers
+        servers = self.select(server_ids)
+
+        # Pull each image once up front, servers sharing an image would
+        # otherwise pull it concurrently from ``containers.run``.
+        images = {s.container.image for s in servers}
+        await asyncio.gather(*(pull(client, image) for image in images))
+
+        return await asyncio.gather(*(s.start(client) for s in servers))
 
     async def stop(
         self,
@@ -371,24 +508,20 @@ class Servers(BaseModel):
             return
 
         logger.info("Killing test containers.")
-        if not server_ids:
-            server_ids = self.servers_included
-        tasks = (s.stop(client, force) for s in self.servers if s.id in server_ids)
+        tasks = (s.stop(client, force) for s in self.select(server_ids))
         await asyncio.gather(*tasks)
 
     def clean(self, client: docker.DockerClient) -> None:
         """Clean up all existing containers specified by this
-        configuration."""
+        configuration. Running containers are killed and removed in one
+        request each."""
 
         logger.warning("Removing test containers.")
-        containers: List[DockerContainer] = list(
-            container
-            for server in self.servers
-            if (container := server.get(client)) is not None
-        )
-
-        for container in containers:
-            container.remove()
+        names = {server.container_name() for server in self.servers}
+        listed = client.api.containers(all=True, filters={"label": "sdd-tests"})
+        for item in listed:
+            if any(name.lstrip("/") in names for name in item["Names"]):
+                client.api.remove_container(item["Id"], force=True)
 
 
 # =========================================================================== #
@@ -436,9 +569,11 @@ class WithServers:
 
     def __call__(self, class_or_fn):
         """Add class/function parametrization."""
-        paramnames = "Engine, " + ", ".join(self.params.keys())
+        # Every server should run with every combination of params, ``zip``
+        # would stop at the shortest of them.
+        paramnames = ["Engine", *self.params.keys()]
         params = list(
-            zip(
+            itertools.product(
                 [s.driver for s in self.servers.servers],
                 *self.params.values(),
             )
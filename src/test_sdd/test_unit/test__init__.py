@@ -1,15 +1,18 @@
 import json
 import logging
 import re
-from typing import ClassVar, Dict, List, Tuple, Type
+from collections import Counter
+from operator import itemgetter
+from typing import ClassVar, Dict, List, Mapping, Tuple, Type
 
 import pytest
-from sqlalchemy import Column
-from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute
-from sqlalchemy_dummy_data import DummyMixins, Pks
+from sqlalchemy import Column, create_engine, func, select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute, Mapped, mapped_column
+from sqlalchemy_dummy_data import DummyMixins, Pks, create_dummy_meta
 
 from ..assets import Assets
-from ..cases import Cases
+from ..cases import Cases, SQLAlchemyOrmTuple
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +41,7 @@ class TestCases:
 
     def format_output(self, msgs: Dict[str, Tuple[str, ...]]):
         msg = "Some `cases` did not pass validation. Detail `"
-        msg = json.dumps(msgs, indent=2, default=str) + "`"
+        msg += json.dumps(msgs, indent=2, default=str) + "`"
         return msg
 
     def test_cases(self, ormCases):
@@ -69,6 +72,70 @@ class TestCases:
         self.check_output_attrs(ormCycle, "get_pks", expect)
 
 
+class TestDummyMeta:
+    def test_new(self, ormDecl: SQLAlchemyOrmTuple):
+        _, Base = ormDecl
+        DummyMeta = create_dummy_meta(Base)
+        assert create_dummy_meta(Base) is DummyMeta
+
+        class A:
+            __tablename__ = "a"
+            id: Mapped[int] = mapped_column(primary_key=True)
+
+        T = DummyMeta("A", (A,), {})
+        assert DummyMeta.tables == {"a": T}
+
+        # Registered tables are not created or inspected again.
+        assert DummyMeta("A", (A,), {}) is T
+
+        # A different class using a registered tablename is not swallowed.
+        class A2:
+            __tablename__ = "a"
+            id: Mapped[int] = mapped_column(primary_key=True)
+            x: Mapped[int] = mapped_column()
+
+        with pytest.raises(InvalidRequestError) as err:
+            DummyMeta("Other", (A2,), {})
+        assert "already defined" in str(err.value)
+        assert DummyMeta.tables == {"a": T}
+
+        # Opt out of registration.
+        dict_ = {"__abstract__": True, "__no_dummies__": True}
+        DummyMeta("Abstract", tuple(), dict_)
+        assert DummyMeta.tablenames == {"a"}
+
+        # The flag is also read from raw bases, like `__tablename__`.
+        class Skip:
+            __tablename__ = "skip"
+            __no_dummies__ = True
+            id: Mapped[int] = mapped_column(primary_key=True)
+
+        assert DummyMeta("Skip", (Skip,), {}).__tablename__ == "skip"
+        assert DummyMeta.tablenames == {"a"}
+
+    def test_get_insert_order(self, ormManyMany: Cases):
+        a, *_ = ormManyMany
+        order = a.__dummies__.get_insert_order()  # type: ignore
+        assert order == ("a", "c", "b")
+        assert a.__dummies__.get_insert_order() is order  # type: ignore
+
+    def test_get_insert_order_cycle(self, ormCycle: Cases):
+        # Cycles cannot be ordered.
+        order = ormCycle[0].__dummies__.get_insert_order()  # type: ignore
+        assert order == ("a", "b", "c", "d")
+
+    def test_iter_fk_closure(self, ormManyMany: Cases):
+        a, *_ = ormManyMany
+        closure = list(a.__dummies__.iter_fk_closure("b"))  # type: ignore
+        assert closure[0] == "b"
+        assert sorted(closure) == ["a", "b", "c"]
+        assert list(a.__dummies__.iter_fk_closure("a")) == ["a"]  # type: ignore
+
+    def test_iter_fk_closure_cycle(self, ormCycle: Cases):
+        closure = list(ormCycle[0].__dummies__.iter_fk_closure("a"))  # type: ignore
+        assert closure == ["a", "d", "c", "b"]
+
+
 class TestDummyMixins:
     """Test the methods defined on :class:`DummyMixins` that do not require
     a database connection.
@@ -89,7 +156,7 @@ class TestDummyMixins:
         for k, table in enumerate(ormCycle):
             logger.debug("Checking foreign keys for `%s`.", name := table.__name__)
             fks = table.get_fks()
-            assert isinstance(fks, dict)
+            assert isinstance(fks, Mapping)
             if n := len(fks) != 1:
                 msg = f"Expected at most one edge per node, got `{n}`."
                 raise AssertionError(msg)
@@ -109,7 +176,7 @@ class TestDummyMixins:
 
             # Check grep owner against computed.
             computed_owners = table.get_fk_owners()
-            assert isinstance(computed_owners, dict)
+            assert isinstance(computed_owners, Mapping)
             if len(computed_owners) != 1:
                 msg = "Number of owners of foreign keys should equal number "
                 raise AssertionError(msg + "of foreign keys.")
@@ -160,6 +227,8 @@ class TestDummyMixins:
                 msg = f"Expected only 5 primary keys, got `{n}`."
                 raise AssertionError(msg)
 
+            assert set(table.get_pks(exclude_foreign=True)) == {"id"}
+
     def test_get_fk(self, ormConnected):
         "Unit tests for `_create_coproduct`."
         a, *_ = ormConnected
@@ -177,6 +246,15 @@ class TestDummyMixins:
         pure_fks = a.get_fks(exclude_primary=True)
         assert len(pure_fks) == 0
 
+        # Results are cached and read only.
+        assert a.get_fks(only_primary=True) is primary_fks
+        assert a.get_fk_owners() is a.get_fk_owners()
+        with pytest.raises(TypeError):
+            all_fks["id_b"] = None  # type: ignore
+
+        # The cache lives on the registry, so it goes away with the `Base`.
+        assert a.__dummies__.fk_owners[("a", "fks")] is a.get_fk_owners()
+
     def test__create_coproduct_no_db(self, ormConnected: Cases):
         "Unit tests for `_create_coproduct`."
         a: DummyMixins
@@ -190,6 +268,17 @@ class TestDummyMixins:
         coproduct = a._create_coproduct(self.all_pks, exclude_primary=True)
         assert len(coproduct) == 0
 
+    def test__create_coproduct_selects(self, ormConnected: Cases):
+        "Unit tests for `_create_coproduct` without `all_pks`."
+        a: DummyMixins
+        a, *_ = ormConnected  # type: ignore
+        selects = a._create_coproduct(None, only_primary=True)
+        assert set(selects) == {"id_b", "id_c", "id_d", "id_e"}
+        assert str(selects["id_b"]) == "SELECT b.id \nFROM b"
+
+        # Statements are only constructed once.
+        assert a._create_coproduct(None)["id_b"] is selects["id_b"]
+
     def test__create_iter_fks(self, ormConnected: Cases):
         "Unit tests for `_create_iter_fks`."
         a: DummyMixins
@@ -204,15 +293,90 @@ class TestDummyMixins:
         product = tuple(a._create_iter_fks(self.all_pks, only_primary=True))
         assert len(product) == 4**4
 
-        # Check the size of subsets where one coordinate is constant.
-        for key in ("id_b", "id_c", "id_d", "id_e"):
-            assert sum(1 for fk in product if fk[key] == 1) == 4**3
+        # Count the subsets where one or two coordinates are constant.
+        keys = ("id_b", "id_c", "id_d", "id_e")
+        counts = {key: Counter() for key in keys}
+        pairs: Counter = Counter()
+        for coord in product:
+            for key, count in counts.items():
+                count[coord[key]] += 1
+            pairs[coord["id_b"], coord["id_c"]] += 1
 
-        # Check the size of subsets where two coordinates are constant.
-        assert (
-            sum(1 for coord in product if coord["id_b"] == 2 and coord["id_c"] == 3)
-            == 4**2
-        )
+        assert all(counts[key][1] == 4**3 for key in keys)
+        assert pairs[2, 3] == 4**2
 
         # Ensure that every entry occurs at most once
-        assert len(set(tuple(v.values()) for v in product)) == 4**4
+        assert len(set(map(itemgetter(*keys), product))) == 4**4
+
+        # Ranges may be used in place of lists.
+        all_pks = {t: {k: range(1, 5) for k in v} for t, v in self.all_pks.items()}
+        assert tuple(a._create_iter_fks(all_pks, only_primary=True)) == product
+
+    def test_create_iter_fks(self, ormConnected: Cases):
+        "Unit tests for `create_iter_fks`."
+        a: DummyMixins
+        a, *_ = ormConnected  # type: ignore
+
+        rows = tuple(a.create_iter_fks(self.all_pks))
+        assert len(rows) == 4**4
+
+        keys = {"id", "id_b", "id_c", "id_d", "id_e"}
+        assert all(set(row) == keys for row in rows)
+
+        # Domestic primary keys start after existing keys and are unique.
+        ids = tuple(row["id"] for row in rows)
+        assert min(ids) == 5
+        assert len(set(ids)) == len(ids)
+
+    def test_create_iter_fks_batched(self, ormConnected: Cases):
+        "Unit tests for `create_iter_fks_batched`."
+        a: DummyMixins
+        a, *_ = ormConnected  # type: ignore
+
+        with pytest.raises(ValueError):
+            next(a.create_iter_fks_batched(self.all_pks, 0))
+
+        batches = list(a.create_iter_fks_batched(self.all_pks, 100))
+        assert [len(batch) for batch in batches] == [100, 100, 56]
+        rows = [row for batch in batches for row in batch]
+        assert rows == list(a.create_iter_fks(self.all_pks))
+
+        # Bound tables that would otherwise iterate indefinitely.
+        batches = list(a.create_iter_fks_batched(self.all_pks, 100, limit=150))
+        assert [len(batch) for batch in batches] == [100, 50]
+
+    def test_insert_dummies(self, ormConnected: Cases):
+        "Unit tests for `insert_dummies` against an in memory SQLite database."
+        a: DummyMixins
+        a, *_ = ormConnected  # type: ignore
+
+        engine = create_engine("sqlite://")
+        a.__table__.create(engine)  # type: ignore
+        with engine.connect() as connection:
+            count = a.insert_dummies(connection, self.all_pks, 100)
+            assert count == 4**4
+
+            total = connection.execute(select(func.count()).select_from(a))
+            assert total.scalar() == count
+
+            assert a.__dummies__.insert_rows(connection, "a", []) == 0
+
+    def test_insert_dummies_association(self, ormManyMany: Cases):
+        "Tables whose primary keys are all foreign keys need no keys of their own."
+        a: DummyMixins
+        b: DummyMixins
+        a, b, c = ormManyMany  # type: ignore
+        all_pks = {"a": {"id_a": [1, 2, 3]}, "c": {"id_c": [1, 2]}}
+
+        rows = list(b.create_iter_fks(all_pks))
+        assert len(rows) == 2**2
+        assert all(set(row) == {"id_a", "id_c"} for row in rows)
+        assert len({(row["id_a"], row["id_c"]) for row in rows}) == len(rows)
+
+        engine = create_engine("sqlite://")
+        a.__table__.metadata.create_all(engine)  # type: ignore
+        with engine.connect() as connection:
+            dummies = b.__dummies__
+            dummies.insert_rows(connection, "a", [{"id": k} for k in (1, 2, 3)])
+            dummies.insert_rows(connection, "c", [{"id": k} for k in (1, 2)])
+            assert b.insert_dummies(connection, all_pks) == len(rows)
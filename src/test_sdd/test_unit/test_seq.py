@@ -1,7 +1,16 @@
+import itertools
+
+import pytest
 from sqlalchemy_dummy_data.seq import iters
 
 
 class Test:
+    def test_count(self):
+        assert list(iters.count(2, 4)) == [2, 3, 4]
+        assert list(itertools.islice(iters.count(), 3)) == [1, 2, 3]
+        with pytest.raises(ValueError):
+            iters.count(3, 2)
+
     def test__triangled(self):
         # 2d is easy to verify by comparison.
         d2 = list(iters._triangled(2, start=1, stop=3))
@@ -18,7 +27,10 @@ class Test:
         # This test may be slow. The results will be used lazily.
         for k in range(3, 8):
             d3 = tuple(iters._squared(k, start=1, stop=3))
-            assert len(set(d3)) == len(d3)
+
+            # Every member of the product occurs exactly once.
+            assert len(d3) == 3**k
+            assert set(d3) == set(itertools.product(range(1, 4), repeat=k))
 
     def test_triangled(self):
         d2 = list(iters.triangled("first", "second", "third", start=1, stop=2))
@@ -4,9 +4,6 @@ from typing import Optional
 import typer
 from test_sdd.config import Context
 
-import docker
-
-DOCKER_CLIENT = docker.from_env()
 logger = logging.getLogger(__name__)
 
 
@@ -21,9 +18,13 @@ class ViewsMeta(type):
 
     def __new__(cls, name, bases, namespace):
         logger.info("Processing `%s`.", name)
-        namespace["__typer__"] = typer.Typer()
+        namespace["__typer__"] = typer.Typer(
+            add_completion=False,
+            pretty_exceptions_enable=False,
+            rich_markup_mode=None,
+        )
         commands = {
-            key
+            key: value
             for key, value in namespace.items()
             if isinstance(value, classmethod) and not key.startswith("_")
         }
@@ -36,10 +37,11 @@ class ViewsMeta(type):
     @classmethod
     def add_commands(cls, T, commands):
         # Uses type since cannot decorate classmethods until the class in
-        # created.
+        # created. Bind the classmethods from the namespace directly instead
+        # of looking them up on `T` again.
         t = T.__typer__
-        for command in commands:
-            t.command(command)(getattr(T, command))
+        for command, method in commands.items():
+            t.command(command)(method.__get__(None, T))
 
     @classmethod
     def add_children(cls, name, bases, namespace):
@@ -73,4 +75,10 @@ class ViewsMeta(type):
 class BaseViews(ViewsMixins, metaclass=ViewsMeta):
     @classmethod
     def propogate_ctx(cls):
-        ...
+        """Share :attr:`ctx` with all of the children of `cls`, recursively.
+        Commands read the context from their own view, so this must be called
+        once :attr:`ctx` is set on the root view.
+        """
+        for child in getattr(cls, "__children__", None) or tuple():
+            child.ctx = cls.ctx
+            child.propogate_ctx()
@@ -1,17 +1,36 @@
 import json
-from typing import Annotated, Iterable, List
+import sys
+import textwrap
+from typing import Annotated, List
 
 import typer
 from pydantic import BaseModel
 from test_sdd.views.base import BaseViews
 
 
+def _default(thing) -> List | str:
+    # Match pydantic, which serializes sets as arrays.
+    if isinstance(thing, (set, frozenset)):
+        return list(thing)
+    return str(thing)
+
+
+def dumps(thing) -> str:
+    """Serialize :param:`thing` for printing. Models are serialized by
+    pydantic-core directly instead of going through `model_dump` and then
+    `json.dumps`. Sets become arrays either way.
+    """
+    if isinstance(thing, BaseModel):
+        return thing.model_dump_json(indent=2)
+    return json.dumps(thing, indent=2, default=_default)
+
+
 class Config(BaseViews):
     __subcommand__ = "config"
 
     @classmethod
     def show(cls, path: Annotated[str, typer.Argument()] = None):
-        thing: List[BaseModel] | BaseModel = cls.config
+        thing: List[BaseModel] | BaseModel = cls.ctx.config
         if path:
             for q in path.split("."):
                 try:
@@ -26,7 +45,7 @@ class Config(BaseViews):
                             raise typer.Exit(2)
                     elif q == "*":
                         print("`*` expressions are not yet supported.")
-                        typer.Exit(3)
+                        raise typer.Exit(3)
                     else:
                         thing = getattr(thing, q)
                 except (KeyError, IndexError, AttributeError):
@@ -34,16 +53,14 @@ class Config(BaseViews):
                     raise typer.Exit(1)
 
         print("Interpretted configuration:")
-        if isinstance(thing, Iterable):
-            out = [t.model_dump() if hasattr(t, "model_dump") else t for t in thing]  # type: ignore
-            print(json.dumps(out, indent=2, default=str))
-        elif isinstance(thing, dict):
-            print(json.dumps(thing, indent=2, default=str))
+        # Models and strings are iterable too, only stream actual lists.
+        if isinstance(thing, list):
+            # Dump members one at a time rather than materializing the list.
+            empty = True
+            for t in thing:  # type: ignore
+                sys.stdout.write("[\n" if empty else ",\n")
+                sys.stdout.write(textwrap.indent(dumps(t), "  "))
+                empty = False
+            print("[]" if empty else "\n]")
         else:
-            print(
-                json.dumps(
-                    thing.model_dump() if hasattr(thing, "model_dump") else thing,
-                    indent=2,
-                    default=str,
-                )
-            )
+            print(dumps(thing))
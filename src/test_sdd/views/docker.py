@@ -1,11 +1,24 @@
 import asyncio
+import atexit
 import json
+from typing import Any, Coroutine, Optional, TypeVar
 
-from pydantic import BaseModel
 from test_sdd.views import flags
 from test_sdd.views.base import BaseViews
 
-import docker
+S = TypeVar("S")
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _run(coro: Coroutine[Any, Any, S]) -> S:
+    """Run :param:`coro` on one event loop shared by all commands in this
+    process rather than creating a new loop per command like `asyncio.run`.
+    """
+    global _loop
+    if _loop is None:
+        _loop = asyncio.new_event_loop()
+        atexit.register(_loop.close)
+    return _loop.run_until_complete(coro)
 
 
 class Docker(BaseViews):
@@ -15,16 +28,16 @@ class Docker(BaseViews):
     @classmethod
     def clean(cls):
         print("Cleaning docker containers.")
-        cls.ctx.config.servers.clean()
+        cls.ctx.config.servers.clean(cls.ctx.client)
 
     @classmethod
     def start(cls, server_ids: flags.OServerIds = None):
         print("Starting all docker containers.")
         task = cls.ctx.config.servers.start(
-            cls.ctx,
+            cls.ctx.client,
             server_ids=server_ids,
         )
-        asyncio.run(task)
+        _run(task)
 
     @classmethod
     def stop(
@@ -33,9 +46,9 @@ class Docker(BaseViews):
         force: flags.OForce = False,
     ):
         print("Stopping docker containers")
-        asyncio.run(
-            config.servers.stop(
-                cls.ctx,
+        _run(
+            cls.ctx.config.servers.stop(
+                cls.ctx.client,
                 server_ids=server_ids,
                 force=force,
             )
@@ -44,5 +57,7 @@ class Docker(BaseViews):
     @classmethod
     def hosts(cls, server_ids: flags.OServerIds = None):
         print("Hosts")
-        result = asyncio.run(config.servers.hosts(cls.ctx, server_ids=server_ids))
+        result = _run(
+            cls.ctx.config.servers.hosts(cls.ctx.client, server_ids=server_ids)
+        )
         print(json.dumps(result, indent=2))